@@ -1,13 +1,96 @@
+import array
+import collections
+import collections.abc
+import contextlib
+import contextvars
+import itertools
+import math
+import operator
+import os
+import pathlib
+import random
+import sys
 import typing
 
 import pytest
 from _pytest.outcomes import OutcomeException
 
+from . import _snapshot
+
 T = typing.TypeVar("T")
 V = typing.TypeVar("V")
 K = typing.TypeVar("K")
 
 
+class _SoftFailure(typing.NamedTuple):
+    fail_message: str
+    args: typing.Tuple[typing.Any, ...]
+    filename: str
+    lineno: int
+
+    def render(self) -> str:
+        return f"{self.filename}:{self.lineno}: {_render(self.fail_message, self.args)}"
+
+
+_soft_failures: contextvars.ContextVar[typing.List[_SoftFailure] | None] = (
+    contextvars.ContextVar("_soft_failures", default=None)
+)
+
+
+def _render(fail_message: str, args: typing.Tuple[typing.Any, ...]) -> str:
+    return fail_message.format(*args) if args else fail_message
+
+
+def _call_site() -> typing.Tuple[str, int]:
+    """Returns the location of the first frame outside of this module"""
+    frame = sys._getframe(1)
+    while frame.f_back is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+    return frame.f_code.co_filename, frame.f_lineno
+
+
+@contextlib.contextmanager
+def soft_assertions() -> typing.Iterator[None]:
+    """
+    Collects all failed assertions within the block instead of failing on the first one.
+    The failures are reported together, with their call sites, when the block exits.
+    Messages are only rendered then, so values mutated within the block are reported
+    in their final state.
+    """
+    outer_failures = _soft_failures.get()
+    failures: typing.List[_SoftFailure] = []
+    token = _soft_failures.set(failures)
+    try:
+        yield
+    except BaseException as e:
+        if outer_failures is None and failures:
+            # Keep the collected failures visible, the escaping exception takes precedence
+            e.add_note(_describe_soft_failures(failures))
+        raise
+    finally:
+        _soft_failures.reset(token)
+        if outer_failures is not None:
+            outer_failures.extend(failures)
+    if outer_failures is None and failures:
+        pytest.fail(_describe_soft_failures(failures))
+
+
+def _describe_soft_failures(failures: typing.List[_SoftFailure]) -> str:
+    return f"{len(failures)} assertion(s) failed:\n" + "\n".join(
+        failure.render() for failure in failures
+    )
+
+
+@contextlib.contextmanager
+def _strict_assertions() -> typing.Iterator[None]:
+    """Fails immediately within the block, e.g. to evaluate consumers in soft mode"""
+    token = _soft_failures.set(None)
+    try:
+        yield
+    finally:
+        _soft_failures.reset(token)
+
+
 class AssertThat(typing.Generic[T]):
     """
     Base class for assertions of any type
@@ -21,9 +104,17 @@ class AssertThat(typing.Generic[T]):
         self.with_trace = False
         return self
 
-    def _check(self, condition: bool, fail_message: str) -> None:
-        if not condition:
-            pytest.fail(fail_message, self.with_trace)
+    def _check(self, condition: bool, fail_message: str, *args: typing.Any) -> None:
+        """
+        Fails with the message unless condition holds. The message is formatted with args
+        only when it is reported, so that large values are not rendered for passing checks.
+        """
+        if condition:
+            return
+        failures = _soft_failures.get()
+        if failures is None:
+            pytest.fail(_render(fail_message, args), self.with_trace)
+        failures.append(_SoftFailure(fail_message, args, *_call_site()))
 
     def is_not_none(self) -> typing.Self:
         self._check(self.value is not None, "Value is None")
@@ -37,6 +128,49 @@ class AssertThat(typing.Generic[T]):
         self._check(self.value == value, "Value is not equal to value")
         return self
 
+    def matches_snapshot(
+        self, name: str, directory: str | os.PathLike[str] | None = None
+    ) -> typing.Self:
+        """
+        Verifies that the value matches the stored snapshot. The value is serialized into
+        canonical lines and compared by digest; only on a mismatch it is compared line by
+        line against the snapshot file. Missing snapshots are stored, and pytest's
+        --update-snapshots option rewrites existing ones. Iterators are consumed.
+        :param name: name of the snapshot
+        :param directory: directory of the snapshot, defaults to __snapshots__ next to the test
+        :return:
+        """
+        if directory is None:
+            directory = pathlib.Path(_call_site()[0]).parent / "__snapshots__"
+        path, digest_path = _snapshot.paths(pathlib.Path(directory), name)
+        value = (
+            list(self.value)
+            if isinstance(self.value, collections.abc.Iterator)
+            else self.value
+        )
+
+        if _snapshot.update_snapshots or not path.exists():
+            _snapshot.write(path, digest_path, _snapshot.iter_lines(value))
+            return self
+
+        digest = _snapshot.digest(_snapshot.iter_lines(value))
+        if digest == _snapshot.read_digest(path, digest_path):
+            return self
+
+        count, described = _snapshot.differences(path, _snapshot.iter_lines(value))
+        if count == 0:
+            # Content is unchanged but the digest is missing or stale, e.g. after a merge
+            _snapshot.write_digest(path, digest_path, digest)
+            return self
+        self._check(
+            False,
+            "Value does not match snapshot {}, {} line(s) differ:\n{}",
+            path,
+            count,
+            "\n".join(described),
+        )
+        return self
+
 
 class AssertThatEqualityMixin(AssertThat[T], typing.Generic[T]):
     """
@@ -61,7 +195,7 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
         :param v: value to contain
         :return:
         """
-        self._check(v in self.value, f"{self.value} does not contain {v}")
+        self._check(v in self.value, "{} does not contain {}", self.value, v)
         return self
 
     def contains_only(self, *args: T) -> typing.Self:
@@ -74,12 +208,16 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
         distinct_values_to_contain = set(args)
         self._check(
             len(distinct_values) == len(distinct_values_to_contain),
-            f"Number of distinct values of {args} does not match with {self.value}",
+            "Number of distinct values of {} does not match with {}",
+            args,
+            self.value,
         )
         for value in distinct_values_to_contain:
             self._check(
                 value in distinct_values,
-                f"{self.value} does not contain only {args}",
+                "{} does not contain only {}",
+                self.value,
+                args,
             )
         return self
 
@@ -90,9 +228,16 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
         :return:
         """
 
+        if isinstance(self.value, (list, tuple, str)):
+            contains_exactly = self.value == to_contain
+        else:
+            # Element-wise, as e.g. a range or deque never equals a list
+            contains_exactly = _elements_equal(self.value, to_contain)
         self._check(
-            self.value == to_contain,
-            f"{self.value} does not contain exactly {to_contain}",
+            contains_exactly,
+            "{} does not contain exactly {}",
+            self.value,
+            to_contain,
         )
         return self
 
@@ -107,7 +252,9 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
         for value in to_contain:
             self._check(
                 value in self.value,
-                f"{self.value} does not contain {value}",
+                "{} does not contain {}",
+                self.value,
+                value,
             )
         return self
 
@@ -118,11 +265,15 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
         :return:
         """
         length = len(subsequence)
+        # Sliding window instead of slices, which e.g. deque does not support
+        window: collections.deque[T] = collections.deque(maxlen=length)
         contains = False
-        for i in range(len(self.value)):
-            if self.value[i : i + length] == subsequence:
+        for value in self.value:
+            window.append(value)
+            if len(window) == length and all(map(operator.eq, window, subsequence)):
                 contains = True
-        self._check(contains, f"{self.value} does not contain {subsequence}")
+                break
+        self._check(contains, "{} does not contain {}", self.value, subsequence)
         return self
 
     def contains_only_once(self, sub_sequence: typing.Sequence[T]) -> typing.Self:
@@ -138,12 +289,12 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
                 if value_in_list == value:
                     if found[i]:
                         self._check(
-                            False, f"{self.value} contains {value} multiple times"
+                            False, "{} contains {} multiple times", self.value, value
                         )
                     found[i] = True
 
         self._check(
-            all(found), f"{self.value} does not contain all values {sub_sequence}"
+            all(found), "{} does not contain all values {}", self.value, sub_sequence
         )
         return self
 
@@ -153,7 +304,60 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
         :param size: size of the sequence to verify
         :return:
         """
-        self._check(len(self.value) == size, f"{self.value} has not size {size}")
+        self._check(len(self.value) == size, "{} has not size {}", self.value, size)
+        return self
+
+    def is_sorted(self) -> typing.Self:
+        """
+        Verifies that the sequence is sorted in ascending order
+        :return:
+        """
+        return self._check_order(operator.gt, "is not sorted")
+
+    def is_sorted_descending(self) -> typing.Self:
+        """
+        Verifies that the sequence is sorted in descending order
+        :return:
+        """
+        return self._check_order(operator.lt, "is not sorted descending")
+
+    def is_sorted_by(
+        self, key: typing.Callable[[T], typing.Any], reverse: bool = False
+    ) -> typing.Self:
+        """
+        Verifies that the sequence is sorted by the given key
+        :param key: function that extracts the comparison key of an element
+        :param reverse: whether the sequence should be sorted in descending order
+        :return:
+        """
+        return self._check_order(
+            operator.lt if reverse else operator.gt, "is not sorted by key", key
+        )
+
+    def is_strictly_increasing(self) -> typing.Self:
+        """
+        Verifies that every element of the sequence is greater than its predecessor
+        :return:
+        """
+        return self._check_order(operator.ge, "is not strictly increasing")
+
+    def _check_order(
+        self,
+        inverted: typing.Callable[[typing.Any, typing.Any], typing.Any],
+        fail_message: str,
+        key: typing.Callable[[T], typing.Any] | None = None,
+    ) -> typing.Self:
+        index = _first_inversion(self.value, inverted, key)
+        if index is not None:
+            # Only render the offending pair, the sequence might be huge
+            self._check(
+                False,
+                "Sequence {}: {!r} at index {} is followed by {!r}",
+                fail_message,
+                self.value[index],
+                index,
+                self.value[index + 1],
+            )
         return self
 
     def first(
@@ -190,7 +394,8 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
         any_satisfies_give_consumer = False
         for value in self.value:
             try:
-                consumer(value)
+                with _strict_assertions():
+                    consumer(value)
                 any_satisfies_give_consumer = True
                 break
             except OutcomeException:
@@ -209,7 +414,8 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
         satisfies_given_consumer = False
         for value in self.value:
             try:
-                consumer(value)
+                with _strict_assertions():
+                    consumer(value)
                 satisfies_given_consumer = True
             except OutcomeException:
                 pass
@@ -238,6 +444,50 @@ class AssertThatSequence(AssertThat, typing.Generic[T]):
             [getattr(v, attribute.__name__)() for v in self.value]
         )
 
+    def sampled(
+        self,
+        n: int | None = None,
+        fraction: float | None = None,
+        seed: int | None = None,
+        stratify_by: typing.Callable[[T], typing.Hashable] | None = None,
+    ) -> "AssertThatSample[T]":
+        """
+        Restricts the following assertions to a reproducible random sample of the sequence.
+        :param n: number of elements to sample (per stratum if stratify_by is given)
+        :param fraction: fraction of elements to sample (per stratum if stratify_by is given)
+        :param seed: seed of the random generator, a random seed is chosen and reported if omitted
+        :param stratify_by: function that returns the stratum of an element
+        :return:
+        """
+        return _sampled(self.value, n, fraction, seed, stratify_by)
+
+
+def _first_inversion(
+    values: typing.Iterable[T],
+    inverted: typing.Callable[[typing.Any, typing.Any], typing.Any],
+    key: typing.Callable[[T], typing.Any] | None = None,
+) -> int | None:
+    """
+    Returns the index of the first element that is inverted with respect to its successor.
+    Pairs are compared lazily in a single pass, without copying the values.
+    """
+    if key is None and isinstance(values, range):
+        # Ranges are monotonic, so only their first pair can be inverted
+        return 0 if _length(values) > 1 and inverted(values[0], values[1]) else None
+    if key is None and type(values).__module__ == "numpy" and values.ndim == 1:  # type: ignore
+        # One-dimensional NumPy arrays: compare all adjacent pairs vectorized. Checked by
+        # module, as e.g. pandas Series would align the shifted slices on their index.
+        inversions = inverted(values[:-1], values[1:]).nonzero()[0]  # type: ignore
+        return int(inversions[0]) if len(inversions) else None
+    if key is not None:
+        values = map(key, values)
+    return next(
+        itertools.compress(
+            itertools.count(), itertools.starmap(inverted, itertools.pairwise(values))
+        ),
+        None,
+    )
+
 
 class AssertThatList(AssertThatSequence[T]):
     """
@@ -257,6 +507,312 @@ class AssertThatTuple(AssertThatSequence[T]):
         super().__init__(value)
 
 
+class AssertThatIterator(AssertThat, typing.Generic[T]):
+    """
+    Assertions for iterators, e.g. generators, which can only be consumed once
+    """
+
+    def __init__(self, value: typing.Iterator[T]) -> None:
+        super().__init__(value)
+
+    def sampled(
+        self,
+        n: int | None = None,
+        fraction: float | None = None,
+        seed: int | None = None,
+        stratify_by: typing.Callable[[T], typing.Hashable] | None = None,
+    ) -> "AssertThatSample[T]":
+        """
+        Consumes the iterator in a single pass and restricts the following assertions to a
+        reproducible random sample of its elements. Uses reservoir sampling for n and selects
+        every element independently with the given probability for fraction.
+        :param n: number of elements to sample (per stratum if stratify_by is given)
+        :param fraction: fraction of elements to sample (per stratum if stratify_by is given)
+        :param seed: seed of the random generator, a random seed is chosen and reported if omitted
+        :param stratify_by: function that returns the stratum of an element
+        :return:
+        """
+        return _sampled(self.value, n, fraction, seed, stratify_by)
+
+
+def _sampled(
+    values: typing.Iterable[T],
+    n: int | None,
+    fraction: float | None,
+    seed: int | None,
+    stratify_by: typing.Callable[[T], typing.Hashable] | None,
+) -> "AssertThatSample[T]":
+    if (n is None) == (fraction is None):
+        raise ValueError("Exactly one of n and fraction must be given")
+    if n is not None and n < 1:
+        raise ValueError(f"n must be positive, got {n}")
+    if fraction is not None and not 0 < fraction <= 1:
+        raise ValueError(f"fraction must be in (0, 1], got {fraction}")
+    if seed is None:
+        seed = random.randrange(2**32)
+    rng = random.Random(seed)
+
+    if isinstance(values, collections.abc.Sequence):
+        population_size = _length(values)
+        sample = _sample_sized(values, n, fraction, rng, stratify_by)
+    else:
+        population_size, sample = _sample_stream(values, n, fraction, rng, stratify_by)
+    assertion = AssertThatSample(
+        sample, population_size, seed, uniform=stratify_by is None
+    )
+    # Assertions on an empty sample would pass without checking anything
+    assertion._check(len(sample) > 0, "Sample is empty")
+    return assertion
+
+
+class AssertThatSample(AssertThatSequence[T]):
+    """
+    Assertions for a random sample of a sequence, see AssertThatSequence.sampled
+    """
+
+    def __init__(
+        self,
+        value: typing.List[T],
+        population_size: int,
+        seed: int,
+        uniform: bool = True,
+        sample_size: int | None = None,
+    ) -> None:
+        super().__init__(value)
+        self.population_size = population_size
+        self.seed = seed
+        # Size of the drawn sample, which stays the same after filtering
+        self.sample_size = len(value) if sample_size is None else sample_size
+        # Whether every element of the population was equally likely to be sampled
+        self.uniform = uniform
+        self.failures = 0
+
+    def _derive(self, value: typing.List[V], uniform: bool) -> "AssertThatSample[V]":
+        sample = AssertThatSample(
+            value, self.population_size, self.seed, uniform, self.sample_size
+        )
+        sample.failures = self.failures
+        return sample
+
+    def _describe_sample(self) -> str:
+        description = (
+            f"sample of {self.sample_size} out of {self.population_size} elements, "
+            f"seed={self.seed}"
+        )
+        if len(self.value) != self.sample_size:
+            description += f", {len(self.value)} left after filtering"
+        return description
+
+    def _check(self, condition: bool, fail_message: str, *args: typing.Any) -> None:
+        if not condition:
+            self.failures += 1
+            super()._check(False, f"{fail_message} ({self._describe_sample()})", *args)
+
+    def all_satisfy(self, consumer: typing.Callable[[T], typing.Any]) -> typing.Self:
+        for value in self.value:
+            try:
+                with _strict_assertions():
+                    consumer(value)
+            except OutcomeException as e:
+                self._check(
+                    False, e.msg or "Element does not satisfy the given assertions"
+                )
+        return self
+
+    def filtered_on(
+        self, predicate: typing.Callable[[T], bool]
+    ) -> "AssertThatSample[T]":
+        # Filtering depends on the elements, the result is no uniform sample of the population
+        return self._derive(
+            [value for value in self.value if predicate(value)], uniform=False
+        )
+
+    def extracting(self, attribute: typing.Callable[[], V]) -> "AssertThatSample[V]":
+        return self._derive(
+            [getattr(v, attribute.__name__)() for v in self.value], uniform=self.uniform
+        )
+
+    def bounds_failure_rate_below(
+        self, rate: float, confidence: float = 0.95
+    ) -> typing.Self:
+        """
+        Verifies that the sample is large enough to conclude, with the given confidence, that the
+        failure rate of the population is below rate. The bound only holds for a uniform sample
+        without failures, so it fails for stratified or filtered samples and after any failed
+        assertion on the sample (e.g. in soft mode).
+        :param rate: maximal failure rate of the population
+        :param confidence: confidence level of the bound
+        :return:
+        """
+        if not self.uniform:
+            self._check(
+                False, "Failure rate can only be bounded for a uniform random sample"
+            )
+            return self
+        if self.failures:
+            self._check(
+                False,
+                "Failure rate can not be bounded, {} assertion(s) on the sample failed",
+                self.failures,
+            )
+            return self
+        upper_bound = (
+            1 - (1 - confidence) ** (1 / len(self.value)) if self.value else 1.0
+        )
+        self._check(
+            upper_bound < rate,
+            f"Failure rate is only bounded by {upper_bound:.6g} "
+            f"at confidence {confidence}, not below {rate}",
+        )
+        return self
+
+
+def _sample_sized(
+    values: typing.Sequence[T],
+    n: int | None,
+    fraction: float | None,
+    rng: random.Random,
+    stratify_by: typing.Callable[[T], typing.Hashable] | None,
+) -> typing.List[T]:
+    if stratify_by is None:
+        strata = [range(_length(values))]
+    else:
+        groups: typing.Dict[typing.Hashable, typing.List[int]] = {}
+        for i, value in enumerate(values):
+            groups.setdefault(stratify_by(value), []).append(i)
+        strata = list(groups.values())
+
+    indices: typing.List[int] = []
+    for stratum in strata:
+        size = _length(stratum)
+        k = (
+            min(n, size)
+            if n is not None
+            else max(1, math.ceil(typing.cast(float, fraction) * size))
+        )
+        indices.extend(stratum[i] for i in _sample_indices(size, k, rng))
+    indices.sort()
+    return [values[i] for i in indices]
+
+
+def _sample_indices(size: int, k: int, rng: random.Random) -> typing.Set[int]:
+    """
+    Selects k distinct indices below size uniformly (Floyd's algorithm). Unlike
+    random.sample, it does not call len(), which overflows for huge ranges.
+    """
+    selected: typing.Set[int] = set()
+    for j in range(size - k, size):
+        i = rng.randrange(j + 1)
+        selected.add(j if i in selected else i)
+    return selected
+
+
+def _sample_stream(
+    values: typing.Iterable[T],
+    n: int | None,
+    fraction: float | None,
+    rng: random.Random,
+    stratify_by: typing.Callable[[T], typing.Hashable] | None,
+) -> typing.Tuple[int, typing.List[T]]:
+    population_size = 0
+    reservoirs: typing.Dict[typing.Hashable, typing.List[typing.Tuple[int, T]]] = {}
+    seen: typing.Dict[typing.Hashable, int] = {}
+    for i, value in enumerate(values):
+        population_size += 1
+        stratum = stratify_by(value) if stratify_by is not None else None
+        reservoir = reservoirs.setdefault(stratum, [])
+        if n is None:
+            if rng.random() < typing.cast(float, fraction):
+                reservoir.append((i, value))
+            continue
+        seen[stratum] = seen.get(stratum, 0) + 1
+        if len(reservoir) < n:
+            reservoir.append((i, value))
+        else:
+            j = rng.randrange(seen[stratum])
+            if j < n:
+                reservoir[j] = (i, value)
+    sample = sorted(
+        (item for reservoir in reservoirs.values() for item in reservoir),
+        key=lambda item: item[0],
+    )
+    return population_size, [value for _, value in sample]
+
+
+class AssertThatRange(AssertThatSequence[int]):
+    """
+    Assertions for ranges, membership and size are computed arithmetically
+    """
+
+    def __init__(self, value: range) -> None:
+        super().__init__(value)
+
+    def has_size(self, size: int) -> typing.Self:
+        """
+        Verifies that the range has size
+        :param size: size of the range to verify
+        :return:
+        """
+        self._check(_length(self.value) == size, "{} has not size {}", self.value, size)
+        return self
+
+    def contains_only(self, *args: int) -> typing.Self:
+        """
+        Verifies that the range only contains the given values, ignoring duplicates.
+        :param args: values to contain
+        :return:
+        """
+        distinct_values_to_contain = set(args)
+        self._check(
+            _length(self.value) == len(distinct_values_to_contain),
+            "Number of distinct values of {} does not match with {}",
+            args,
+            self.value,
+        )
+        for value in distinct_values_to_contain:
+            self._check(
+                value in self.value, "{} does not contain only {}", self.value, args
+            )
+        return self
+
+    def contains_only_once(self, sub_sequence: typing.Sequence[int]) -> typing.Self:
+        """
+        Verifies that the range contains only once of every given values.
+        As values of a range are distinct, this verifies that it contains all of them.
+        :param sub_sequence: values to contain only once
+        :return:
+        """
+        self._check(
+            all(value in self.value for value in sub_sequence),
+            "{} does not contain all values {}",
+            self.value,
+            sub_sequence,
+        )
+        return self
+
+
+def _length(values: typing.Sized) -> int:
+    """Returns the length of values, also for ranges longer than sys.maxsize"""
+    if isinstance(values, range):
+        step = values.step
+        return max(
+            0, (values.stop - values.start + step - (1 if step > 0 else -1)) // step
+        )
+    return len(values)
+
+
+def _elements_equal(values: typing.Iterable[T], other: typing.Iterable[T]) -> bool:
+    if isinstance(values, range) and isinstance(other, range):
+        return values == other
+    missing = object()
+    return all(
+        value == other_value
+        for value, other_value in itertools.zip_longest(
+            values, other, fillvalue=missing
+        )
+    )
+
+
 class AssertThatString(AssertThatSequence[str], AssertThatEqualityMixin[str]):
     """
     Assertions for strings
@@ -267,13 +823,13 @@ class AssertThatString(AssertThatSequence[str], AssertThatEqualityMixin[str]):
 
     def starts_with(self, value: str) -> typing.Self:
         self._check(
-            self.value.startswith(value), f"{self.value} does not start with {value}"
+            self.value.startswith(value), "{} does not start with {}", self.value, value
         )
         return self
 
     def ends_with(self, value: str) -> typing.Self:
         self._check(
-            self.value.endswith(value), f"{self.value} does not start with {value}"
+            self.value.endswith(value), "{} does not start with {}", self.value, value
         )
         return self
 
@@ -298,7 +854,9 @@ class AssertThatDict(
         for key in keys:
             self._check(
                 self.value.get(key) is not None,
-                f"{self.value} does not contain key {key}",
+                "{} does not contain key {}",
+                self.value,
+                key,
             )
         return self
 
@@ -311,7 +869,9 @@ class AssertThatDict(
         for key in keys:
             self._check(
                 self.value.get(key) is None,
-                f"{self.value} does contain key {key}",
+                "{} does contain key {}",
+                self.value,
+                key,
             )
         return self
 
@@ -325,7 +885,9 @@ class AssertThatDict(
         for value in values:
             self._check(
                 value in dictionary_values,
-                f"{self.value} does not contain value {value}",
+                "{} does not contain value {}",
+                self.value,
+                value,
             )
         return self
 
@@ -334,7 +896,7 @@ class AssertThatDict(
         Verify that the dictionary is empty
         :return:
         """
-        self._check(len(self.value) == 0, f"{self.value} is not empty")
+        self._check(len(self.value) == 0, "{} is not empty", self.value)
         return self
 
     def is_not_empty(self) -> typing.Self:
@@ -342,7 +904,7 @@ class AssertThatDict(
         Verify that the dictionary is not empty
         :return:
         """
-        self._check(len(self.value) != 0, f"{self.value} is empty")
+        self._check(len(self.value) != 0, "{} is empty", self.value)
         return self
 
     def extracting(self, key: K) -> AssertThat[V | None]:
@@ -354,6 +916,118 @@ class AssertThatDict(
         return assert_that(self.value.get(key))
 
 
+class AssertThatSet(AssertThat, typing.Generic[T]):
+    """
+    Assertions for sets, frozensets and other set types (e.g. dictionary keys)
+    """
+
+    def __init__(self, value: typing.AbstractSet[T]) -> None:
+        super().__init__(value)
+
+    def contains(self, v: T) -> typing.Self:
+        """
+        Verifies that the set contains the given value
+        :param v: value to contain
+        :return:
+        """
+        self._check(v in self.value, "{} does not contain {}", self.value, v)
+        return self
+
+    def does_not_contain(self, v: T) -> typing.Self:
+        """
+        Verifies that the set does not contain the given value
+        :param v: value not to contain
+        :return:
+        """
+        self._check(v not in self.value, "{} does contain {}", self.value, v)
+        return self
+
+    def contains_only(self, *args: T) -> typing.Self:
+        """
+        Verifies that the set only contains the given values, ignoring duplicates.
+        :param args: values to contain
+        :return:
+        """
+        self._check(
+            self.value == frozenset(args),
+            "{} does not contain only {}",
+            self.value,
+            args,
+        )
+        return self
+
+    def has_size(self, size: int) -> typing.Self:
+        """
+        Verifies that the set has size
+        :param size: size of the set to verify
+        :return:
+        """
+        self._check(len(self.value) == size, "{} has not size {}", self.value, size)
+        return self
+
+    def is_empty(self) -> typing.Self:
+        """
+        Verify that the set is empty
+        :return:
+        """
+        self._check(len(self.value) == 0, "{} is not empty", self.value)
+        return self
+
+    def is_not_empty(self) -> typing.Self:
+        """
+        Verify that the set is not empty
+        :return:
+        """
+        self._check(len(self.value) != 0, "{} is empty", self.value)
+        return self
+
+    def is_subset_of(self, values: typing.Iterable[T]) -> typing.Self:
+        """
+        Verify that every element of the set is contained in the given values
+        :param values: values to be a subset of
+        :return:
+        """
+        self._check(
+            self.value <= _as_set(values),
+            "{} is not a subset of {}",
+            self.value,
+            values,
+        )
+        return self
+
+    def is_superset_of(self, values: typing.Iterable[T]) -> typing.Self:
+        """
+        Verify that the set contains every element of the given values
+        :param values: values to be a superset of
+        :return:
+        """
+        self._check(
+            self.value >= _as_set(values),
+            "{} is not a superset of {}",
+            self.value,
+            values,
+        )
+        return self
+
+    def is_disjoint_from(self, values: typing.Iterable[T]) -> typing.Self:
+        """
+        Verify that the set contains none of the given values
+        :param values: values to be disjoint from
+        :return:
+        """
+        self._check(
+            self.value.isdisjoint(values),
+            "{} is not disjoint from {}",
+            self.value,
+            values,
+        )
+        return self
+
+
+def _as_set(values: typing.Iterable[T]) -> typing.AbstractSet[T]:
+    return values if isinstance(values, collections.abc.Set) else frozenset(values)
+
+
 @typing.overload
 def assert_that(value: typing.List[T]) -> AssertThatList[T]: ...
 
@@ -370,6 +1044,26 @@ def assert_that(value: str) -> AssertThatString: ...
 def assert_that(value: typing.Dict[K, V]) -> AssertThatDict[K, V]: ...
 
 
+@typing.overload
+def assert_that(value: range) -> AssertThatRange: ...
+
+
+@typing.overload
+def assert_that(value: typing.AbstractSet[T]) -> AssertThatSet[T]: ...
+
+
+@typing.overload
+def assert_that(value: "array.array[T]") -> AssertThatSequence[T]: ...
+
+
+@typing.overload
+def assert_that(value: typing.Sequence[T]) -> AssertThatSequence[T]: ...
+
+
+@typing.overload
+def assert_that(value: typing.Iterator[T]) -> AssertThatIterator[T]: ...
+
+
 @typing.overload
 def assert_that(value: T) -> AssertThat[T]: ...
 
@@ -389,5 +1083,19 @@ def assert_that(value: typing.Any) -> AssertThat:
             return AssertThatString(value)
         case dict():
             return AssertThatDict(value)
+        case range():
+            return AssertThatRange(value)
+        case collections.abc.Set():
+            return AssertThatSet(value)
+        case collections.abc.Sequence() if not isinstance(
+            value, (bytes, bytearray, memoryview)
+        ):
+            # Other sequences like deque are asserted without copying them to a list
+            return AssertThatSequence(value)
+        case collections.abc.Iterator():
+            return AssertThatIterator(value)
+        case _ if type(value).__module__ == "numpy" and getattr(value, "ndim", 0) == 1:
+            # One-dimensional NumPy arrays are sequences, but not registered as such
+            return AssertThatSequence(value)
         case _:
             return AssertThat(value)
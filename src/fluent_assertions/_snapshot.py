@@ -0,0 +1,193 @@
+import collections.abc
+import dataclasses
+import hashlib
+import itertools
+import json
+import os
+import pathlib
+import re
+import typing
+
+# Set by the pytest plugin from the --update-snapshots option
+update_snapshots = False
+
+SUFFIX = ".snap"
+DIGEST_SUFFIX = ".sha256"
+# Default reprs contain the address of the object, which differs between runs
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+>")
+
+
+def iter_lines(value: typing.Any) -> typing.Iterator[str]:
+    """
+    Serializes the value into canonical lines. The first line describes the kind of
+    value, every element of a collection follows on its own line, so that snapshots of
+    large collections can be written, hashed and compared in a streaming fashion.
+    """
+    match value:
+        case str() | bytes() | bytearray():
+            yield "value"
+            yield _encode(value)
+        case collections.abc.Mapping():
+            yield "mapping"
+            yield from sorted(_encode([key, value[key]]) for key in value)
+        case collections.abc.Set():
+            yield "set"
+            yield from sorted(map(_encode, value))
+        case collections.abc.Iterable() if not dataclasses.is_dataclass(value):
+            yield "sequence"
+            yield from map(_encode, value)
+        case _:
+            yield "value"
+            yield _encode(value)
+
+
+def digest(lines: typing.Iterable[str]) -> str:
+    sha256 = hashlib.sha256()
+    for line in lines:
+        sha256.update(line.encode())
+        sha256.update(b"\n")
+    return sha256.hexdigest()
+
+
+def paths(
+    directory: pathlib.Path, name: str
+) -> typing.Tuple[pathlib.Path, pathlib.Path]:
+    path = directory / f"{name}{SUFFIX}"
+    return path, path.with_name(path.name + DIGEST_SUFFIX)
+
+
+def read_digest(path: pathlib.Path, digest_path: pathlib.Path) -> str | None:
+    """
+    Returns the stored digest of the snapshot, unless the snapshot file was changed
+    since the digest was written, e.g. by a manual edit or a merge
+    """
+    try:
+        hexdigest, size, mtime = digest_path.read_text().split()
+    except (FileNotFoundError, ValueError):
+        return None
+    if _file_state(path) != (size, mtime):
+        return None
+    return hexdigest
+
+
+def write(
+    path: pathlib.Path, digest_path: pathlib.Path, lines: typing.Iterable[str]
+) -> None:
+    """Writes the snapshot and its digest, replacing existing files atomically"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sha256 = hashlib.sha256()
+    temporary_path = path.with_name(path.name + ".tmp")
+    try:
+        with temporary_path.open("w", encoding="utf-8", newline="\n") as file:
+            for line in lines:
+                data = line + "\n"
+                sha256.update(data.encode())
+                file.write(data)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+    os.replace(temporary_path, path)
+    write_digest(path, digest_path, sha256.hexdigest())
+
+
+def write_digest(path: pathlib.Path, digest_path: pathlib.Path, hexdigest: str) -> None:
+    """Writes the digest together with the size and mtime of the snapshot file"""
+    temporary_path = digest_path.with_name(digest_path.name + ".tmp")
+    temporary_path.write_text(" ".join((hexdigest, *_file_state(path))) + "\n")
+    os.replace(temporary_path, digest_path)
+
+
+def _file_state(path: pathlib.Path) -> typing.Tuple[str, str]:
+    stat = path.stat()
+    return str(stat.st_size), str(stat.st_mtime_ns)
+
+
+def differences(
+    path: pathlib.Path, lines: typing.Iterable[str], limit: int = 5
+) -> typing.Tuple[int, typing.List[str]]:
+    """
+    Compares the lines with the stored snapshot line by line, without loading it.
+    Returns the number of differing lines and descriptions of the first ones.
+    """
+    count = 0
+    described: typing.List[str] = []
+    with path.open(encoding="utf-8", newline="\n") as file:
+        stored_lines = (line.removesuffix("\n") for line in file)
+        for number, (expected, actual) in enumerate(
+            itertools.zip_longest(stored_lines, lines), start=1
+        ):
+            if expected == actual:
+                continue
+            count += 1
+            if len(described) < limit:
+                described.append(
+                    f"line {number}: expected {_shorten(expected)}, "
+                    f"actual {_shorten(actual)}"
+                )
+    return count, described
+
+
+def _shorten(line: str | None, width: int = 200) -> str:
+    if line is None:
+        return "<missing>"
+    return line if len(line) <= width else line[: width - 3] + "..."
+
+
+def _encode(value: typing.Any) -> str:
+    return json.dumps(
+        _canonical(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def _canonical(value: typing.Any) -> typing.Any:
+    """Converts the value into JSON data that does not depend on set or dict ordering"""
+    match value:
+        case None | bool() | int() | float() | str():
+            return value
+        case bytes() | bytearray():
+            return {"__bytes__": value.hex()}
+        case collections.abc.Mapping():
+            if all(isinstance(key, str) for key in value):
+                return {key: _canonical(item) for key, item in value.items()}
+            return {"__items__": sorted(_encode([key, value[key]]) for key in value)}
+        case collections.abc.Set():
+            return {"__set__": sorted(map(_encode, value))}
+        case list() | tuple():
+            return [_canonical(item) for item in value]
+        case _ if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return {
+                "__type__": type(value).__qualname__,
+                **{
+                    field.name: _canonical(getattr(value, field.name))
+                    for field in dataclasses.fields(value)
+                },
+            }
+        case _:
+            representation = repr(value)
+            if type(value).__repr__ is not object.__repr__ and not _ADDRESS.search(
+                representation
+            ):
+                # e.g. Decimal, datetime or Enum, whose repr does not depend on identity
+                return {"__repr__": representation}
+            attributes = _attributes(value)
+            if attributes is None:
+                raise TypeError(
+                    f"{type(value).__qualname__} has no canonical form for snapshots"
+                )
+            return {
+                "__type__": type(value).__qualname__,
+                **{name: _canonical(item) for name, item in attributes.items()},
+            }
+
+
+def _attributes(value: typing.Any) -> typing.Dict[str, typing.Any] | None:
+    """Returns the instance attributes from __dict__ and __slots__, if there are any"""
+    if not hasattr(value, "__dict__") and not hasattr(type(value), "__slots__"):
+        return None
+    attributes = dict(getattr(value, "__dict__", {}))
+    for cls in type(value).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in [slots] if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(value, name):
+                attributes[name] = getattr(value, name)
+    return attributes
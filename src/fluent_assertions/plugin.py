@@ -0,0 +1,24 @@
+"""
+Pytest plugin of fluent-assertions, registered via the pytest11 entry point
+"""
+
+import pytest
+
+from . import _snapshot
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--update-snapshots",
+        action="store_true",
+        default=False,
+        help="Rewrite the snapshots of matches_snapshot assertions",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    _snapshot.update_snapshots = config.getoption("update_snapshots")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    _snapshot.update_snapshots = False
@@ -1,3 +1,4 @@
+import array
 import dataclasses
 
 import pytest
@@ -51,6 +52,12 @@ class TestAssertThatList:
         with pytest.raises(OutcomeException):
             assert_that([1, 2, 3]).contains_exactly([1, 2])
 
+        with pytest.raises(OutcomeException):
+            assert_that([1, 2]).contains_exactly((1, 2))
+
+        with pytest.raises(OutcomeException):
+            assert_that([1, 2]).contains_exactly(x for x in [1, 2])
+
         with pytest.raises(OutcomeException):
             assert_that([1, 2, 3]).contains_exactly([1, 2, 3, 4])
 
@@ -172,3 +179,48 @@ class TestAssertThatList:
                     FakeClass(name="fake-name-2", value="fake value 2"),
                 ]
             ).extracting(FakeClass.get_name).first().is_equal_to("fake-name-2")
+
+    def test_assert_is_sorted(self):
+        assert_that([1, 2, 2, 3]).is_sorted()
+        assert_that([]).is_sorted()
+
+    def test_assert_is_sorted_should_fail(self):
+        with pytest.raises(OutcomeException, match="at index 2"):
+            assert_that([1, 2, 3, 0]).is_sorted()
+
+    def test_assert_is_sorted_descending(self):
+        assert_that([3, 2, 2, 1]).is_sorted_descending()
+
+    def test_assert_is_sorted_descending_should_fail(self):
+        with pytest.raises(OutcomeException, match="at index 0"):
+            assert_that([1, 2]).is_sorted_descending()
+
+    def test_assert_is_sorted_by(self):
+        assert_that(
+            [
+                FakeClass(name="fake-name-1", value="fake value 2"),
+                FakeClass(name="fake-name-2", value="fake value 1"),
+            ]
+        ).is_sorted_by(lambda x: x.name).is_sorted_by(lambda x: x.value, reverse=True)
+
+    def test_assert_is_sorted_by_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(
+                [
+                    FakeClass(name="fake-name-1", value="fake value 2"),
+                    FakeClass(name="fake-name-2", value="fake value 1"),
+                ]
+            ).is_sorted_by(lambda x: x.value)
+
+    def test_assert_is_strictly_increasing(self):
+        assert_that([1, 2, 3]).is_strictly_increasing()
+
+    def test_assert_is_strictly_increasing_should_fail(self):
+        with pytest.raises(OutcomeException, match="at index 1"):
+            assert_that([1, 2, 2, 3]).is_strictly_increasing()
+
+    def test_assert_is_sorted_array(self):
+        assert_that(array.array("i", [1, 2, 3])).is_sorted()
+
+        with pytest.raises(OutcomeException, match="at index 1"):
+            assert_that(array.array("i", [1, 3, 2])).is_sorted()
@@ -0,0 +1,72 @@
+import sys
+
+import pytest
+from _pytest.outcomes import OutcomeException
+
+from src.fluent_assertions import assert_that
+
+
+class TestAssertThatRange:
+    def test_assert_contains(self):
+        assert_that(range(10**18)).contains(10**17).has_size(10**18)
+
+    def test_assert_contains_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(range(0, 10, 2)).contains(3)
+
+    def test_assert_contains_only(self):
+        assert_that(range(1, 4)).contains_only(1, 2, 3, 1)
+
+    def test_assert_contains_only_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(range(1, 4)).contains_only(1, 2)
+
+        with pytest.raises(OutcomeException):
+            assert_that(range(1, 4)).contains_only(1, 2, 4)
+
+    def test_assert_contains_only_once(self):
+        assert_that(range(10**18)).contains_only_once([2, 1])
+
+    def test_assert_contains_only_once_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(range(3)).contains_only_once([2, 3])
+
+    def test_assert_contains_subsequence(self):
+        assert_that(range(10)).contains_subsequence([3, 4, 5])
+
+    def test_assert_first_and_last(self):
+        assert_that(range(10**18)).is_sorted().last().is_equal_to(10**18 - 1)
+
+    def test_assert_has_size_beyond_maxsize(self):
+        assert_that(range(10**19)).has_size(10**19)
+        assert_that(range(10**19, 0, -3)).has_size(3333333333333333334)
+
+    def test_assert_has_size_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(range(10**19)).has_size(10**19 - 1)
+
+    def test_assert_contains_exactly(self):
+        assert_that(range(3)).contains_exactly([0, 1, 2])
+        assert_that(range(10**19)).contains_exactly(range(10**19))
+
+    def test_assert_contains_exactly_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(range(3)).contains_exactly([0, 1])
+
+        with pytest.raises(OutcomeException):
+            assert_that(range(3)).contains_exactly([0, 2, 1])
+
+    def test_assert_is_sorted_beyond_maxsize(self):
+        assert_that(
+            range(-sys.maxsize, sys.maxsize)
+        ).is_sorted().is_strictly_increasing()
+
+        with pytest.raises(OutcomeException, match="at index 0"):
+            assert_that(range(sys.maxsize, -sys.maxsize, -1)).is_sorted()
+
+    def test_sampled_beyond_maxsize(self):
+        sample = assert_that(range(-sys.maxsize, sys.maxsize)).sampled(n=10, seed=1)
+        sample.has_size(10).is_strictly_increasing().all_satisfy(
+            lambda x: assert_that(-sys.maxsize <= x < sys.maxsize).is_equal_to(True)
+        )
+        assert_that(sample.population_size).is_equal_to(2 * sys.maxsize)
@@ -0,0 +1,128 @@
+import pytest
+from _pytest.outcomes import OutcomeException
+
+from src.fluent_assertions import assert_that, soft_assertions
+
+
+class TestAssertThatSample:
+    def test_sampled_with_n(self):
+        assert_that(list(range(1000))).sampled(n=10, seed=1).has_size(10)
+
+    def test_sampled_with_fraction(self):
+        assert_that(list(range(1000))).sampled(fraction=0.05, seed=1).has_size(50)
+
+    def test_sampled_is_reproducible(self):
+        first = assert_that(list(range(1000))).sampled(n=10, seed=42)
+        second = assert_that(list(range(1000))).sampled(n=10, seed=42)
+        assert_that(first.value).contains_exactly(second.value)
+
+    def test_sampled_keeps_order(self):
+        sample = assert_that(list(range(1000))).sampled(n=20, seed=3)
+        assert_that(sample.value).contains_exactly(sorted(sample.value))
+
+    def test_sampled_stratified(self):
+        (
+            assert_that(list(range(1000)))
+            .sampled(n=5, seed=7, stratify_by=lambda x: x % 3)
+            .has_size(15)
+            .filtered_on(lambda x: x % 3 == 0)
+            .has_size(5)
+        )
+
+    def test_sampled_from_iterator(self):
+        streamed = assert_that(x for x in range(1000)).sampled(n=10, seed=5)
+        assert_that(streamed.value).has_size(10).is_sorted()
+        assert_that(streamed.population_size).is_equal_to(1000)
+
+    def test_sampled_from_iterator_is_reproducible(self):
+        first = assert_that(iter(range(1000))).sampled(fraction=0.1, seed=5)
+        second = assert_that(iter(range(1000))).sampled(fraction=0.1, seed=5)
+        assert_that(first.value).contains_exactly(second.value)
+
+    def test_sampled_from_iterator_stratified(self):
+        assert_that(x for x in range(1000)).sampled(
+            n=5, seed=7, stratify_by=lambda x: x % 2
+        ).has_size(10).filtered_on(lambda x: x % 2 == 1).has_size(5)
+
+    def test_sampled_all_satisfy(self):
+        assert_that(list(range(1000))).sampled(n=10).all_satisfy(
+            lambda x: assert_that(x < 1000).is_equal_to(True)
+        )
+
+    def test_sampled_all_satisfy_should_fail_with_seed(self):
+        with pytest.raises(OutcomeException, match="seed=11"):
+            assert_that(list(range(1000))).sampled(n=10, seed=11).all_satisfy(
+                lambda x: assert_that(x).is_none()
+            )
+
+    def test_sampled_none_satisfy_should_fail_with_sample_size(self):
+        with pytest.raises(OutcomeException, match="sample of 10 out of 1000"):
+            assert_that(list(range(1000))).sampled(n=10, seed=11).none_satisfy(
+                lambda x: assert_that(x).is_not_none()
+            )
+
+    def test_sampled_extracting(self):
+        assert_that(["a", "b", "c"]).sampled(n=3, seed=0).extracting(
+            str.upper
+        ).contains_exactly(["A", "B", "C"])
+
+    def test_sampled_should_reject_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            assert_that([1, 2, 3]).sampled()
+
+        with pytest.raises(ValueError):
+            assert_that([1, 2, 3]).sampled(n=1, fraction=0.5)
+
+    def test_bounds_failure_rate_below(self):
+        assert_that(list(range(10000))).sampled(n=3000, seed=1).all_satisfy(
+            lambda x: assert_that(x).is_not_none()
+        ).bounds_failure_rate_below(0.001)
+
+    def test_bounds_failure_rate_below_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(list(range(10000))).sampled(
+                n=100, seed=1
+            ).bounds_failure_rate_below(0.001)
+
+    def test_bounds_failure_rate_below_should_fail_for_stratified_sample(self):
+        with pytest.raises(OutcomeException, match="uniform"):
+            assert_that(list(range(10000))).sampled(
+                n=3000, seed=1, stratify_by=lambda x: x % 2
+            ).bounds_failure_rate_below(0.01)
+
+    def test_bounds_failure_rate_below_should_fail_for_filtered_sample(self):
+        with pytest.raises(OutcomeException, match="uniform"):
+            assert_that(list(range(10000))).sampled(n=3000, seed=1).filtered_on(
+                lambda x: x % 2 == 0
+            ).bounds_failure_rate_below(0.01)
+
+    def test_bounds_failure_rate_below_should_fail_after_soft_failures(self):
+        with pytest.raises(OutcomeException, match="can not be bounded"):
+            with soft_assertions():
+                assert_that(list(range(100))).sampled(n=100, seed=1).all_satisfy(
+                    lambda x: assert_that(x == 5).is_equal_to(False)
+                ).bounds_failure_rate_below(0.5)
+
+    def test_sampled_with_small_fraction_is_not_empty(self):
+        assert_that(list(range(10))).sampled(fraction=0.01, seed=1).has_size(1)
+
+        with pytest.raises(OutcomeException):
+            assert_that(list(range(10))).sampled(fraction=0.01, seed=1).all_satisfy(
+                lambda x: assert_that(x).is_none()
+            )
+
+    def test_sampled_should_fail_for_empty_sample(self):
+        with pytest.raises(OutcomeException, match="Sample is empty"):
+            assert_that([]).sampled(n=10, seed=1)
+
+        with pytest.raises(OutcomeException, match="Sample is empty"):
+            assert_that(iter(range(10))).sampled(fraction=0.001, seed=1)
+
+    def test_sampled_should_report_drawn_sample_size_after_filtering(self):
+        with pytest.raises(
+            OutcomeException,
+            match="sample of 10 out of 1000 elements, seed=3, 5 left after filtering",
+        ):
+            assert_that(list(range(1000))).sampled(n=10, seed=3).filtered_on(
+                lambda x: x % 2 == 0
+            ).has_size(4)
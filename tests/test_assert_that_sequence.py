@@ -0,0 +1,77 @@
+import array
+import collections
+
+import pytest
+from _pytest.outcomes import OutcomeException
+
+from src.fluent_assertions import AssertThat, AssertThatSequence, assert_that
+
+
+class TestAssertThatSequence:
+    def test_assert_that_deque(self):
+        values = collections.deque([1, 2, 3])
+        assertion = assert_that(values)
+        assert_that(isinstance(assertion, AssertThatSequence)).is_equal_to(True)
+        assert_that(assertion.value is values).is_equal_to(True)
+
+    def test_assert_contains(self):
+        assert_that(collections.deque([1, 2, 3])).contains(3).has_size(3)
+
+    def test_assert_contains_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(collections.deque([1, 2, 3])).contains(4)
+
+    def test_assert_contains_subsequence(self):
+        assert_that(collections.deque([1, 2, 3, 4])).contains_subsequence([2, 3])
+
+    def test_assert_contains_subsequence_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(collections.deque([1, 2, 3])).contains_subsequence([1, 3])
+
+    def test_assert_first_and_last(self):
+        assert_that(collections.deque([1, 2, 3])).first().is_equal_to(1)
+        assert_that(collections.deque([1, 2, 3])).last().is_equal_to(3)
+
+    def test_assert_contains_exactly(self):
+        assert_that(collections.deque([1, 2])).contains_exactly([1, 2])
+
+    def test_assert_contains_exactly_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that(collections.deque([1, 2])).contains_exactly([2, 1])
+
+        with pytest.raises(OutcomeException):
+            assert_that(collections.deque([1, 2])).contains_exactly([1, 2, 3])
+
+    def test_assert_that_binary_sequences_are_not_routed(self):
+        for value in [b"ab", bytearray(b"ab")]:
+            assert_that(type(assert_that(value))).is_equal_to(AssertThat)
+
+    def test_assert_that_array(self):
+        values = array.array("i", [1, 2, 3])
+        assertion = assert_that(values)
+        assert_that(type(assertion)).is_equal_to(AssertThatSequence)
+        assertion.contains(2).has_size(3).contains_exactly([1, 2, 3])
+
+    def test_assert_contains_exactly_generator(self):
+        assert_that(collections.deque([1, 2])).contains_exactly(x for x in [1, 2])
+
+        with pytest.raises(OutcomeException):
+            assert_that(collections.deque([1, 2])).contains_exactly(x for x in [1])
+
+    def test_assert_is_sorted_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        values = numpy.array([1, 2, 2, 3])
+        assert_that(type(assert_that(values))).is_equal_to(AssertThatSequence)
+        assert_that(values).is_sorted().contains(3).contains_exactly([1, 2, 2, 3])
+        assert_that(numpy.array([3.0, 2.0, 1.0])).is_sorted_descending()
+
+        with pytest.raises(OutcomeException, match="at index 2"):
+            assert_that(numpy.array([1, 2, 3, 1, 0])).is_sorted()
+
+        with pytest.raises(OutcomeException, match="at index 1"):
+            assert_that(numpy.array([1, 2, 2])).is_strictly_increasing()
+
+    def test_assert_that_numpy_matrix_is_not_routed(self):
+        numpy = pytest.importorskip("numpy")
+        matrix = numpy.array([[1, 2], [3, 4]])
+        assert_that(type(assert_that(matrix))).is_equal_to(AssertThat)
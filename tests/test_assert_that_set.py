@@ -0,0 +1,66 @@
+import pytest
+from _pytest.outcomes import OutcomeException
+
+from src.fluent_assertions import AssertThatSet, assert_that
+
+
+class TestAssertThatSet:
+    def test_assert_that_set_types(self):
+        assert_that(isinstance(assert_that({1}), AssertThatSet)).is_equal_to(True)
+        assert_that(isinstance(assert_that(frozenset()), AssertThatSet)).is_equal_to(
+            True
+        )
+        assert_that(
+            isinstance(assert_that({"a": 1}.keys()), AssertThatSet)
+        ).is_equal_to(True)
+
+    def test_assert_contains(self):
+        assert_that({1, 2, 3}).contains(3).does_not_contain(4)
+        assert_that({"test-1": "value-1"}.keys()).contains("test-1")
+
+    def test_assert_contains_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that({1, 2, 3}).contains(4)
+
+        with pytest.raises(OutcomeException):
+            assert_that(frozenset({1, 2, 3})).does_not_contain(3)
+
+    def test_assert_contains_only(self):
+        assert_that({1, 2, 3}).contains_only(1, 2, 3, 1)
+
+    def test_assert_contains_only_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that({1, 2, 3}).contains_only(1, 2)
+
+    def test_assert_has_size(self):
+        assert_that({1, 2, 3}).has_size(3).is_not_empty()
+        assert_that(set()).has_size(0).is_empty()
+
+    def test_assert_has_size_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that({1, 2, 3}).has_size(2)
+
+        with pytest.raises(OutcomeException):
+            assert_that({1}).is_empty()
+
+    def test_assert_is_subset_of(self):
+        assert_that({1, 2}).is_subset_of([1, 2, 3])
+        assert_that({"a": 1}.keys()).is_subset_of(["a", "b"])
+
+    def test_assert_is_subset_of_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that({1, 4}).is_subset_of({1, 2, 3})
+
+    def test_assert_is_superset_of(self):
+        assert_that(frozenset({1, 2, 3})).is_superset_of(range(1, 3))
+
+    def test_assert_is_superset_of_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that({1, 2}).is_superset_of([1, 2, 3])
+
+    def test_assert_is_disjoint_from(self):
+        assert_that({1, 2}).is_disjoint_from([3, 4])
+
+    def test_assert_is_disjoint_from_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that({1, 2}).is_disjoint_from([2, 3])
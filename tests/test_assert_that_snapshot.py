@@ -0,0 +1,110 @@
+import dataclasses
+
+import pytest
+from _pytest.outcomes import OutcomeException
+
+from src.fluent_assertions import _snapshot, assert_that
+
+
+@dataclasses.dataclass
+class FakeClass:
+    name: str
+    value: str
+
+
+class TestAssertThatSnapshot:
+    def test_matches_snapshot_should_store_missing_snapshot(self, tmp_path):
+        assert_that([1, 2, 3]).matches_snapshot("fake-snapshot", tmp_path)
+
+        assert_that((tmp_path / "fake-snapshot.snap").read_text()).is_equal_to(
+            "sequence\n1\n2\n3\n"
+        )
+        assert_that((tmp_path / "fake-snapshot.snap.sha256").exists()).is_equal_to(True)
+
+    def test_matches_snapshot(self, tmp_path):
+        value = {
+            "names": {"b", "a"},
+            "users": [FakeClass(name="fake-name", value="fake value")],
+        }
+        assert_that(value).matches_snapshot("fake-snapshot", tmp_path)
+        assert_that(
+            {
+                "users": [FakeClass(name="fake-name", value="fake value")],
+                "names": {"a", "b"},
+            }
+        ).matches_snapshot("fake-snapshot", tmp_path)
+
+    def test_matches_snapshot_should_fail_with_differences(self, tmp_path):
+        assert_that(list(range(100))).matches_snapshot("fake-snapshot", tmp_path)
+
+        with pytest.raises(OutcomeException) as e:
+            assert_that([*range(50), -1, *range(51, 100), 100]).matches_snapshot(
+                "fake-snapshot", tmp_path
+            )
+
+        assert_that(e.value.msg).contains("2 line(s) differ").contains(
+            "line 52: expected 50, actual -1"
+        ).contains("line 102: expected <missing>, actual 100")
+
+    def test_matches_snapshot_should_repair_stale_digest(self, tmp_path):
+        assert_that([1, 2]).matches_snapshot("fake-snapshot", tmp_path)
+        digest_path = tmp_path / "fake-snapshot.snap.sha256"
+        digest_path.write_text("stale\n")
+
+        assert_that([1, 2]).matches_snapshot("fake-snapshot", tmp_path)
+        assert_that(digest_path.read_text()).starts_with(
+            _snapshot.digest(_snapshot.iter_lines([1, 2])) + " "
+        )
+
+    def test_matches_snapshot_should_detect_edited_snapshot(self, tmp_path):
+        assert_that([1, 2]).matches_snapshot("fake-snapshot", tmp_path)
+        (tmp_path / "fake-snapshot.snap").write_text("sequence\n1\n30\n")
+
+        with pytest.raises(OutcomeException, match="line 3: expected 30, actual 2"):
+            assert_that([1, 2]).matches_snapshot("fake-snapshot", tmp_path)
+
+    def test_matches_snapshot_should_update_snapshot(self, tmp_path, monkeypatch):
+        assert_that("fake value").matches_snapshot("fake-snapshot", tmp_path)
+
+        monkeypatch.setattr(_snapshot, "update_snapshots", True)
+        assert_that("other value").matches_snapshot("fake-snapshot", tmp_path)
+
+        monkeypatch.setattr(_snapshot, "update_snapshots", False)
+        assert_that("other value").matches_snapshot("fake-snapshot", tmp_path)
+        with pytest.raises(OutcomeException):
+            assert_that("fake value").matches_snapshot("fake-snapshot", tmp_path)
+
+    def test_matches_snapshot_of_iterator(self, tmp_path):
+        assert_that(iter([1, 2])).matches_snapshot("fake-snapshot", tmp_path)
+        assert_that(x for x in [1, 2]).matches_snapshot("fake-snapshot", tmp_path)
+
+    def test_matches_snapshot_of_plain_objects(self, tmp_path):
+        class FakePlainClass:
+            def __init__(self, name):
+                self.name = name
+
+        class FakeSlotsClass:
+            __slots__ = ("name",)
+
+            def __init__(self, name):
+                self.name = name
+
+        assert_that(
+            [FakePlainClass("fake-name"), FakeSlotsClass("fake-name")]
+        ).matches_snapshot("fake-snapshot", tmp_path)
+        assert_that(
+            [FakePlainClass("fake-name"), FakeSlotsClass("fake-name")]
+        ).matches_snapshot("fake-snapshot", tmp_path)
+
+        with pytest.raises(OutcomeException, match="line 2"):
+            assert_that(
+                [FakePlainClass("other-name"), FakeSlotsClass("fake-name")]
+            ).matches_snapshot("fake-snapshot", tmp_path)
+
+    def test_matches_snapshot_should_reject_values_without_canonical_form(
+        self, tmp_path
+    ):
+        with pytest.raises(TypeError):
+            assert_that([object()]).matches_snapshot("fake-snapshot", tmp_path)
+
+        assert_that(list(tmp_path.iterdir())).has_size(0)
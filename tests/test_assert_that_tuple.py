@@ -67,3 +67,10 @@ class TestAssertThatTuple:
 
         with pytest.raises(OutcomeException):
             assert_that((1, 3, 2, 3)).contains_only_once((2, 3))
+
+    def test_assert_is_sorted(self):
+        assert_that((1, 2, 3)).is_sorted().is_strictly_increasing()
+
+    def test_assert_is_sorted_should_fail(self):
+        with pytest.raises(OutcomeException):
+            assert_that((3, 2, 1)).is_sorted()
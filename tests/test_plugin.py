@@ -0,0 +1,42 @@
+import pathlib
+
+from src.fluent_assertions import assert_that
+
+pytest_plugins = ["pytester"]
+
+SOURCE_DIRECTORY = pathlib.Path(__file__).parents[1] / "src"
+
+
+class TestPlugin:
+    def test_update_snapshots(self, pytester, monkeypatch):
+        monkeypatch.setenv("PYTHONPATH", str(SOURCE_DIRECTORY))
+        pytester.makepyfile(
+            test_fake="""
+            import os
+
+            from fluent_assertions import assert_that
+
+
+            def test_fake():
+                assert_that([os.environ["FAKE_VALUE"]]).matches_snapshot("fake-snapshot")
+            """
+        )
+        snapshot_path = pytester.path / "__snapshots__" / "fake-snapshot.snap"
+
+        monkeypatch.setenv("FAKE_VALUE", "fake-value-1")
+        pytester.runpytest_subprocess("-p", "fluent_assertions.plugin").assert_outcomes(
+            passed=1
+        )
+
+        monkeypatch.setenv("FAKE_VALUE", "fake-value-2")
+        pytester.runpytest_subprocess("-p", "fluent_assertions.plugin").assert_outcomes(
+            failed=1
+        )
+        pytester.runpytest_subprocess(
+            "-p", "fluent_assertions.plugin", "--update-snapshots"
+        ).assert_outcomes(passed=1)
+        pytester.runpytest_subprocess("-p", "fluent_assertions.plugin").assert_outcomes(
+            passed=1
+        )
+
+        assert_that(snapshot_path.read_text()).is_equal_to('sequence\n"fake-value-2"\n')
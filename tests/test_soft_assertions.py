@@ -0,0 +1,60 @@
+import pytest
+from _pytest.outcomes import OutcomeException
+
+from src.fluent_assertions import assert_that, soft_assertions
+
+
+class TestSoftAssertions:
+    def test_soft_assertions(self):
+        with soft_assertions():
+            assert_that([1, 2, 3]).contains(3).has_size(3)
+            assert_that({"name": "fake-name"}).contains_keys(["name"])
+
+    def test_soft_assertions_should_fail_with_all_failures(self):
+        with pytest.raises(OutcomeException) as e:
+            with soft_assertions():
+                assert_that([1, 2, 3]).contains(4).has_size(2)
+                assert_that("fake string").starts_with("string")
+
+        assert_that(e.value.msg).contains("3 assertion(s) failed").contains(
+            "[1, 2, 3] does not contain 4"
+        ).contains("[1, 2, 3] has not size 2").contains(
+            "fake string does not start with string"
+        ).contains("test_soft_assertions.py:")
+
+    def test_soft_assertions_should_collect_consumer_failures(self):
+        with pytest.raises(OutcomeException, match="2 assertion"):
+            with soft_assertions():
+                assert_that([1, 2]).all_satisfy(lambda x: assert_that(x).is_none())
+
+    def test_soft_assertions_any_satisfy(self):
+        with soft_assertions():
+            assert_that([1, 2]).any_satisfy(lambda x: assert_that(x).is_equal_to(2))
+            assert_that([1, 2]).none_satisfy(lambda x: assert_that(x).is_none())
+
+    def test_nested_soft_assertions_should_fail_once(self):
+        with pytest.raises(OutcomeException, match="2 assertion"):
+            with soft_assertions():
+                with soft_assertions():
+                    assert_that(1).is_none()
+                assert_that(2).is_none()
+
+    def test_soft_assertions_should_render_values_at_exit(self):
+        values = [1, 2]
+        with pytest.raises(OutcomeException) as e:
+            with soft_assertions():
+                assert_that(values).has_size(3)
+                values.append(3)
+
+        assert_that(e.value.msg).contains("[1, 2, 3] has not size 3")
+
+    def test_soft_assertions_should_keep_failures_on_other_exceptions(self):
+        with pytest.raises(KeyError) as e:
+            with soft_assertions():
+                assert_that(1).is_none()
+                raise KeyError("fake-key")
+
+        assert_that(e.value.__notes__).has_size(1).first().is_not_none()
+        assert_that(e.value.__notes__[0]).contains("1 assertion(s) failed").contains(
+            "Value is not None"
+        )